@@ -39,6 +39,10 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=requirements,
+    extras_require={
+        "fast": ["orjson>=3.6"],
+        "msgpack": ["msgpack>=1.0"],
+    },
     include_package_data=True,
     zip_safe=False,
 )
\ No newline at end of file
@@ -0,0 +1,16 @@
+from django.test import TestCase, override_settings
+from voltwire.checks import check_compression_middleware
+
+
+class VoltWireChecksTest(TestCase):
+
+    @override_settings(MIDDLEWARE=[])
+    def test_compression_middleware_missing(self):
+        """Test a warning is reported without compression middleware"""
+        errors = check_compression_middleware(None)
+        self.assertEqual([error.id for error in errors], ['voltwire.W001'])
+
+    @override_settings(MIDDLEWARE=['django.middleware.gzip.GZipMiddleware'])
+    def test_compression_middleware_installed(self):
+        """Test no warning is reported with GZipMiddleware"""
+        self.assertEqual(check_compression_middleware(None), [])
\ No newline at end of file
@@ -1,20 +1,33 @@
+import json
 from django.test import TestCase, RequestFactory
-from django.contrib.auth.models import User
-from voltwire.components import VoltWireComponent
-from voltwire.decorators import layout, title, validate
+from django.contrib.auth.decorators import login_required
+from django.contrib.auth.models import AnonymousUser, User
+from django.utils.decorators import method_decorator
+from voltwire.components import VoltWireComponent, ReactiveProperty
+from voltwire.decorators import layout, title
 
 
 class TestVoltWireComponent(VoltWireComponent):
     """Test component for unit testing"""
 
-    @validate('required|min:3')
-
-    test_property = ''
+    test_property = ReactiveProperty('', rules='required|min:3')
 
     def get(self, request):
         return self.render(request)
 
 
+@method_decorator(login_required, name='get')
+class LoginRequiredComponent(TestVoltWireComponent):
+    """Test component protected by a class decorator"""
+
+
+class MountComponent(TestVoltWireComponent):
+    """Test component assigning properties in mount()"""
+
+    def mount(self, request, *args, **kwargs):
+        self.posts = ['first', 'second']
+
+
 class VoltWireComponentTest(TestCase):
 
     def setUp(self):
@@ -29,6 +42,20 @@ class VoltWireComponentTest(TestCase):
         component = TestVoltWireComponent()
         self.assertEqual(component.test_property, '')
 
+    def test_reactive_attrs(self):
+        """Test reactive properties are discovered from the class"""
+        self.assertEqual(TestVoltWireComponent._reactive_attrs(), ('test_property',))
+
+    def test_mount_assigned_property(self):
+        """Test attributes assigned in mount() reach the context"""
+        component = MountComponent()
+        component.setup(self.factory.get('/test/'))
+
+        context = component.get_voltwire_context()
+        self.assertEqual(context['posts'], ['first', 'second'])
+        self.assertEqual(context['voltwire_properties']['posts'], ['first', 'second'])
+        self.assertNotIn('request', context)
+
     def test_component_dispatch(self):
         """Test component request dispatch"""
         request = self.factory.get('/test/')
@@ -37,6 +64,26 @@ class VoltWireComponentTest(TestCase):
         response = component.dispatch(request)
         self.assertEqual(response.status_code, 200)
 
+    def test_method_decorator(self):
+        """Test class decorators applied to handlers are honoured by dispatch"""
+        request = self.factory.get('/test/')
+        request.user = AnonymousUser()
+
+        response = LoginRequiredComponent().dispatch(request)
+        self.assertEqual(response.status_code, 302)
+
+    def test_unencodable_property(self):
+        """Test properties the encoder rejects are sent as str()"""
+        for stream in (False, True):
+            request = self.factory.get('/test/', HTTP_X_VOLTWIRE_REQUEST='true')
+            component = TestVoltWireComponent()
+            component._stream = stream
+            component.test_property = {(1, 2): 'a'}
+
+            response = component.dispatch(request)
+            content = b''.join(response.streaming_content) if stream else response.content
+            self.assertEqual(json.loads(content)['properties'], {'test_property': "{(1, 2): 'a'}"})
+
     def test_validation(self):
         """Test property validation"""
         component = TestVoltWireComponent()
@@ -46,6 +93,20 @@ class VoltWireComponentTest(TestCase):
         self.assertFalse(is_valid)
         self.assertIn('test_property', component.get_errors())
 
+    def test_instance_validation_rules(self):
+        """Test validation rules set on the instance override the class rules"""
+        component = TestVoltWireComponent()
+        component.test_property = 'abcd'
+        component._validation_rules = {'test_property': 'min:5'}
+
+        self.assertFalse(component.is_valid())
+        self.assertIn('test_property', component.get_errors())
+
+    def test_reactive_property_rules(self):
+        """Test ReactiveProperty registers its rules on the class"""
+        self.assertEqual(TestVoltWireComponent._validation_rules, {'test_property': 'required|min:3'})
+        self.assertEqual(VoltWireComponent._validation_rules, {})
+
     def test_redirect_voltwire_request(self):
         """Test redirect for VoltWire requests"""
         request = self.factory.post('/test/',
@@ -55,4 +116,4 @@ class VoltWireComponentTest(TestCase):
 
         response = component.redirect('admin:index')
         self.assertEqual(response.status_code, 200)
-        self.assertIn('redirect', response.json())
\ No newline at end of file
+        self.assertIn('redirect', json.loads(response.content))
\ No newline at end of file
@@ -0,0 +1,45 @@
+import json
+from decimal import Decimal
+from django.test import TestCase
+from voltwire.json import FastJsonResponse, StreamingJsonResponse
+
+
+class FastJsonResponseTest(TestCase):
+
+    def test_json_content(self):
+        """Test response content and content type"""
+        response = FastJsonResponse({'success': True, 'html': '<div></div>'})
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(json.loads(response.content), {'success': True, 'html': '<div></div>'})
+
+    def test_non_serializable_values(self):
+        """Test values that are not JSON serializable fall back to str"""
+        response = FastJsonResponse({'price': Decimal('9.99')})
+        self.assertEqual(json.loads(response.content), {'price': '9.99'})
+
+    def test_non_string_keys(self):
+        """Test dicts with int keys are encoded with string keys"""
+        response = FastJsonResponse({'p': {1: 'a'}})
+        self.assertEqual(json.loads(response.content), {'p': {'1': 'a'}})
+
+    def test_big_integers(self):
+        """Test integers wider than 64 bits are encoded"""
+        response = FastJsonResponse({'n': 2 ** 70})
+        self.assertEqual(json.loads(response.content), {'n': 2 ** 70})
+
+
+class StreamingJsonResponseTest(TestCase):
+
+    def test_streamed_content(self):
+        """Test chunked encoding produces the same JSON document"""
+        data = {'success': True, 'html': '<p class="a">caf\u00e9 \\ \U0001f600</p>' * 10, 'errors': {}}
+        response = StreamingJsonResponse(data, stream_key='html', chunk_size=7)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(json.loads(b''.join(response.streaming_content)), data)
+
+    def test_streamed_non_string_keys(self):
+        """Test the non-streamed part is encoded like FastJsonResponse"""
+        data = {'html': '<div></div>', 'properties': {1: 'a', 'n': 2 ** 70}}
+        response = StreamingJsonResponse(data, stream_key='html')
+        self.assertEqual(json.loads(b''.join(response.streaming_content)),
+                         {'html': '<div></div>', 'properties': {'1': 'a', 'n': 2 ** 70}})
\ No newline at end of file
@@ -1,4 +1,4 @@
-from django.test import TestCase, RequestFactory
+from django.test import TestCase, RequestFactory, override_settings
 from django.http import HttpResponse
 from voltwire.middleware import VoltWireMiddleware
 
@@ -14,7 +14,7 @@ class VoltWireMiddlewareTest(TestCase):
         request = self.factory.get('/test/',
                                    HTTP_X_VOLTWIRE_SPA='true')
 
-        self.middleware.process_request(request)
+        self.middleware(request)
         self.assertTrue(hasattr(request, 'is_voltwire_spa'))
         self.assertTrue(request.is_voltwire_spa)
 
@@ -23,6 +23,31 @@ class VoltWireMiddlewareTest(TestCase):
         request = self.factory.post('/test/',
                                     HTTP_X_VOLTWIRE_REQUEST='true')
 
-        self.middleware.process_request(request)
+        self.middleware(request)
         self.assertTrue(hasattr(request, 'is_voltwire_component'))
-        self.assertTrue(request.is_voltwire_component)
\ No newline at end of file
+        self.assertTrue(request.is_voltwire_component)
+
+    def test_regular_request(self):
+        """Test regular requests are flagged as non-component requests"""
+        request = self.factory.get('/test/')
+
+        self.middleware(request)
+        self.assertFalse(request.is_voltwire_component)
+
+    def test_script_injection(self):
+        """Test voltwire.js is injected before </head> of HTML responses"""
+        middleware = VoltWireMiddleware(
+            lambda r: HttpResponse('<html><head></head><body>caf\u00e9</body></html>')
+        )
+        response = middleware(self.factory.get('/test/'))
+
+        content = response.content.decode('utf-8')
+        self.assertIn('voltwire.js"></script>\n</head>', content)
+        self.assertIn('caf\u00e9', content)
+
+    @override_settings(VOLTWIRE={'AUTO_INCLUDE_SCRIPTS': False})
+    def test_script_injection_disabled(self):
+        """Test AUTO_INCLUDE_SCRIPTS disables script injection"""
+        middleware = VoltWireMiddleware(lambda r: HttpResponse('<html><head></head></html>'))
+        response = middleware(self.factory.get('/test/'))
+        self.assertEqual(response.content, b'<html><head></head></html>')
\ No newline at end of file
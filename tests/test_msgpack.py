@@ -0,0 +1,26 @@
+from unittest import skipIf
+from django.test import TestCase, RequestFactory
+from voltwire.msgpack import MsgPackResponse, accepts_msgpack, msgpack
+
+
+@skipIf(msgpack is None, 'msgpack is not installed')
+class MsgPackResponseTest(TestCase):
+
+    def test_msgpack_content(self):
+        """Test bytes are packed as raw bin data"""
+        response = MsgPackResponse({'success': True, 'html': b'<div></div>'})
+        self.assertEqual(response['Content-Type'], 'application/msgpack')
+        self.assertEqual(msgpack.unpackb(response.content), {'success': True, 'html': b'<div></div>'})
+
+    def test_accepts_msgpack(self):
+        """Test MessagePack is only used when requested"""
+        factory = RequestFactory()
+        self.assertTrue(accepts_msgpack(factory.post('/test/', HTTP_ACCEPT='application/msgpack')))
+        self.assertFalse(accepts_msgpack(factory.post('/test/')))
+
+    def test_accepts_msgpack_quality(self):
+        """Test q=0 and wildcards do not opt in to MessagePack"""
+        factory = RequestFactory()
+        self.assertTrue(accepts_msgpack(factory.post('/test/', HTTP_ACCEPT='application/json, application/msgpack;q=0.9')))
+        self.assertFalse(accepts_msgpack(factory.post('/test/', HTTP_ACCEPT='application/msgpack;q=0')))
+        self.assertFalse(accepts_msgpack(factory.post('/test/', HTTP_ACCEPT='*/*')))
\ No newline at end of file
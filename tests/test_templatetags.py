@@ -1,5 +1,14 @@
-from django.test import TestCase
-from django.template import Template, Context
+from django.test import TestCase, override_settings
+from django.template import Template, Context, TemplateSyntaxError
+from voltwire.templatetags.voltwire import _get_template_cached
+
+
+def locmem_templates(templates):
+    """TEMPLATES setting serving the given templates from memory"""
+    return [{
+        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'OPTIONS': {'loaders': [('django.template.loaders.locmem.Loader', templates)]},
+    }]
 
 
 class VoltWireTemplateTagsTest(TestCase):
@@ -14,4 +23,32 @@ class VoltWireTemplateTagsTest(TestCase):
         """Test component template tag"""
         template = Template('{% load voltwire %}{% component "TestComponent" %}')
         result = template.render(Context({}))
-        self.assertIn('Component TestComponent not found', result)
\ No newline at end of file
+        self.assertIn('Component TestComponent not found', result)
+
+    def test_voltwire_json_filter(self):
+        """Test voltwire_json filter renders compact JSON"""
+        template = Template('{% load voltwire %}{{ value|voltwire_json }}')
+        result = template.render(Context({'value': {'name': 'caf\u00e9', 'tags': [1, 2]}}))
+        self.assertEqual(result, '{"name":"caf\u00e9","tags":[1,2]}')
+
+    def test_voltwire_include_missing_template(self):
+        """Test voltwire_include renders a comment for missing templates"""
+        template = Template('{% load voltwire %}{% voltwire_include "missing.html" %}')
+        result = template.render(Context({}))
+        self.assertIn('Error including missing.html', result)
+
+    def test_template_cache_cleared_on_templates_change(self):
+        """Test cached component templates follow TEMPLATES changes"""
+        with override_settings(TEMPLATES=locmem_templates({'cached.html': 'OLD'})):
+            self.assertEqual(_get_template_cached('cached.html').render({}), 'OLD')
+        with override_settings(TEMPLATES=locmem_templates({'cached.html': 'NEW'})):
+            self.assertEqual(_get_template_cached('cached.html').render({}), 'NEW')
+
+    def test_voltwire_block_tag(self):
+        """Test a closed voltwire block compiles"""
+        Template('{% load voltwire %}{% voltwire %}{{ ignored }}{% endvoltwire %}')
+
+    def test_voltwire_block_tag_unclosed(self):
+        """Test an unclosed voltwire block raises TemplateSyntaxError"""
+        with self.assertRaises(TemplateSyntaxError):
+            Template('{% load voltwire %}{% voltwire %}never closed')
\ No newline at end of file
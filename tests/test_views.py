@@ -0,0 +1,29 @@
+from django.core.exceptions import ImproperlyConfigured
+from django.http import HttpResponse
+from django.test import TestCase, RequestFactory
+from voltwire.components import VoltWireComponent
+from voltwire.views import voltwire_view
+
+
+class HelloComponent(VoltWireComponent):
+    """Test component for voltwire_view"""
+
+    def get(self, request):
+        return HttpResponse('hello')
+
+
+class VoltWireViewTest(TestCase):
+
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def test_dispatches_to_component(self):
+        """Test voltwire_view dispatches requests to the component"""
+        view = voltwire_view('tests.test_views.HelloComponent')
+        response = view(self.factory.get('/'))
+        self.assertEqual(response.content, b'hello')
+
+    def test_missing_component(self):
+        """Test voltwire_view fails at registration for unknown components"""
+        with self.assertRaises(ImproperlyConfigured):
+            voltwire_view('tests.test_views.MissingComponent')
\ No newline at end of file
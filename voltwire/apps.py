@@ -1,5 +1,6 @@
 from django.apps import AppConfig
 from django.conf import settings
+from django.core import checks
 from django.core.exceptions import ImproperlyConfigured
 
 
@@ -11,6 +12,9 @@ class VoltWireConfig(AppConfig):
         # Validate settings
         self._validate_settings()
 
+        from voltwire.checks import check_compression_middleware
+        checks.register(check_compression_middleware)
+
     def _validate_settings(self):
         """Validate VoltWire settings"""
         if not hasattr(settings, 'VOLTWIRE'):
@@ -0,0 +1,24 @@
+from django.conf import settings
+from django.core import checks
+
+# Middleware that compresses VoltWire responses
+COMPRESSION_MIDDLEWARE = (
+    'django.middleware.gzip.GZipMiddleware',
+    'compression_middleware.middleware.CompressionMiddleware',
+)
+
+
+def check_compression_middleware(app_configs, **kwargs):
+    """Component responses carry full HTML, recommend compressing them"""
+    if any(middleware in settings.MIDDLEWARE for middleware in COMPRESSION_MIDDLEWARE):
+        return []
+    return [
+        checks.Warning(
+            "VoltWire responses are not compressed.",
+            hint=(
+                "Add 'django.middleware.gzip.GZipMiddleware' to MIDDLEWARE, or add "
+                "'voltwire.W001' to SILENCED_SYSTEM_CHECKS if a proxy or CDN compresses them."
+            ),
+            id='voltwire.W001',
+        )
+    ]
\ No newline at end of file
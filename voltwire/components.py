@@ -1,18 +1,102 @@
-import json
-import inspect
-from typing import Dict, Any, List, Optional
-from django.http import HttpRequest, HttpResponse, JsonResponse
-from django.shortcuts import render, redirect, get_object_or_404
+from typing import Dict, Any, List, Tuple
+from django.http import HttpRequest, HttpResponse
+from django.shortcuts import render, redirect
+from django.template.loader import get_template, render_to_string
 from django.urls import reverse
+from django.utils.cache import patch_vary_headers
 from django.views import View
-from django.core.exceptions import ValidationError
-from django.utils.decorators import method_decorator
-from django.views.decorators.csrf import csrf_exempt
 from django.contrib import messages
 import re
+from voltwire.json import FastJsonResponse, StreamingJsonResponse, dumps
+from voltwire.msgpack import MsgPackResponse, accepts_msgpack, packb
 
+# Types that can be passed to the JSON encoder as-is
+_JSON_SAFE = (str, int, float, bool, type(None), list, tuple, dict)
 
-class VoltWireComponent(View):
+
+def _serialize_property(value):
+    """
+    Prepare a property value for the client.
+    Containers are left to the response encoder, which falls back to str().
+    """
+    return value if isinstance(value, _JSON_SAFE) else str(value)
+
+
+# Instance attributes set by Django's View, not reactive properties
+_VIEW_INSTANCE_ATTRS = frozenset({'request', 'args', 'kwargs', 'head'})
+
+# Raised by the response encoders, e.g. for dict keys they cannot encode
+_ENCODE_ERRORS = (TypeError, ValueError, OverflowError)
+
+
+def _encodable_properties(properties: Dict[str, Any], encode) -> Dict[str, Any]:
+    """Replace the properties that encode() rejects with their str()"""
+    encodable = {}
+    for name, value in properties.items():
+        try:
+            encode(value)
+        except _ENCODE_ERRORS:
+            value = str(value)
+        encodable[name] = value
+    return encodable
+
+
+def _is_voltwire_request(request: HttpRequest) -> bool:
+    """Flag set once by VoltWireMiddleware; read the header if it is not installed"""
+    is_voltwire_request = getattr(request, 'is_voltwire_component', None)
+    if is_voltwire_request is None:
+        is_voltwire_request = request.META.get('HTTP_X_VOLTWIRE_REQUEST') == 'true'
+    return is_voltwire_request
+
+
+_EMAIL_RE = re.compile(r'^[^@]+@[^@]+\.[^@]+$')
+
+
+def _parse_rules(rules: str) -> List[Tuple[str, Any]]:
+    """
+    Parse a rule string such as 'required|min:3|max:255'
+    into a list of (kind, param) tuples.
+    """
+    parsed = []
+    for rule in rules.split('|'):
+        kind, _, param = rule.strip().partition(':')
+        if not kind:
+            continue
+        if kind in ('min', 'max'):
+            param = int(param)
+        elif not param:
+            param = None
+        parsed.append((kind, param))
+    return parsed
+
+
+class ReactiveProperty:
+    """
+    Declare a reactive property with optional validation rules.
+    Usage: title = ReactiveProperty('', rules='required|min:3|max:255')
+    """
+
+    def __init__(self, default='', rules: str = None):
+        self.default = default
+        self.rules = rules
+
+    def __set_name__(self, owner, name):
+        # Register the rules on the component and replace the declaration with its default
+        if self.rules:
+            owner._validation_rules = {**getattr(owner, '_validation_rules', {}), name: self.rules}
+        setattr(owner, name, self.default)
+
+
+class _VoltWireState:
+    """
+    Per-request component state kept in slots instead of the instance __dict__.
+    View has no __slots__, so components still get a __dict__ for their properties.
+    """
+
+    __slots__ = ('_errors', '_is_voltwire_request')
+
+
+class VoltWireComponent(View, _VoltWireState):
     """
     Base class for all VoltWire components.
     Works exactly like traditional Django class-based views.
@@ -24,16 +108,18 @@ class VoltWireComponent(View):
     _properties = {}
     _validation_rules = {}
 
+    # Stream VoltWire responses whose HTML is larger than this (characters)
+    _stream = False
+    _stream_threshold = 1_000_000
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._errors = {}
         self._is_voltwire_request = False
-        self._initialized_properties = False
 
     def setup(self, request: HttpRequest, *args, **kwargs):
         """Initialize component - similar to Django's setup()"""
         super().setup(request, *args, **kwargs)
-        self._initialize_properties()
         self.mount(request, *args, **kwargs)
 
     def mount(self, request: HttpRequest, *args, **kwargs):
@@ -43,39 +129,81 @@ class VoltWireComponent(View):
         """
         pass
 
-    def _initialize_properties(self):
-        """Initialize reactive properties from class definition"""
-        if self._initialized_properties:
-            return
-
-        for attr_name in dir(self):
-            # Skip private and special methods
-            if attr_name.startswith('_'):
-                continue
+    @classmethod
+    def _method_handlers(cls) -> Dict[str, Any]:
+        """
+        HTTP method handlers of the component, resolved once per class.
+        Built on first dispatch so that class decorators (e.g. method_decorator)
+        have already replaced the methods; cached on the class.
+        """
+        cached = cls.__dict__.get('_method_handlers_cache')
+        if cached is not None:
+            return cached
+
+        handlers = {
+            method: getattr(cls, method)
+            for method in cls.http_method_names
+            if hasattr(cls, method)
+        }
+        # Same fallback as View.setup(): HEAD is served by get() unless defined
+        if 'get' in handlers and 'head' not in handlers:
+            handlers['head'] = handlers['get']
 
-            attr_value = getattr(self, attr_name)
+        cls._method_handlers_cache = handlers
+        return handlers
 
-            # Skip methods and callables
-            if callable(attr_value):
+    @classmethod
+    def _reactive_attrs(cls) -> tuple:
+        """
+        Names of the public, non-callable attributes declared on the component.
+        Computed once per class by walking the MRO and cached on the class.
+        """
+        cached = cls.__dict__.get('_reactive_attrs_cache')
+        if cached is not None:
+            return cached
+
+        seen = set()
+        names = []
+        for klass in cls.__mro__:
+            # Attributes of Django's View (and object) are not reactive
+            if klass in View.__mro__:
                 continue
+            for attr_name, attr_value in klass.__dict__.items():
+                if attr_name in seen:
+                    continue
+                seen.add(attr_name)
 
-            # Skip if already set in instance
-            if attr_name in self.__dict__:
-                continue
+                # Skip private attributes, methods and descriptors (properties)
+                if attr_name.startswith('_'):
+                    continue
+                if callable(attr_value) or hasattr(attr_value, '__get__'):
+                    continue
 
-            # Set as instance attribute
-            setattr(self, attr_name, attr_value)
+                names.append(attr_name)
 
-        self._initialized_properties = True
+        cls._reactive_attrs_cache = tuple(names)
+        return cls._reactive_attrs_cache
+
+    def _reactive_names(self) -> tuple:
+        """
+        Reactive attribute names of the class, plus public attributes
+        assigned on the instance (e.g. self.posts = ... in mount()).
+        """
+        names = type(self)._reactive_attrs()
+        extra = tuple(
+            attr_name for attr_name, attr_value in self.__dict__.items()
+            if not attr_name.startswith('_')
+            and attr_name not in _VIEW_INSTANCE_ATTRS
+            and attr_name not in names
+            and not callable(attr_value)
+        )
+        return names + extra if extra else names
 
     def dispatch(self, request: HttpRequest, *args, **kwargs):
         """Handle requests with VoltWire awareness"""
-        self._is_voltwire_request = request.headers.get('X-VoltWire-Request') == 'true'
+        self._is_voltwire_request = _is_voltwire_request(request)
 
-        if request.method.lower() in self.http_method_names:
-            handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
-        else:
-            handler = self.http_method_not_allowed
+        handler = type(self)._method_handlers().get(request.method.lower())
 
         # Handle VoltWire actions
         if self._is_voltwire_request and request.method == 'POST':
@@ -83,7 +211,9 @@ class VoltWireComponent(View):
             if action and hasattr(self, action):
                 return getattr(self, action)(request, *args, **kwargs)
 
-        return handler(request, *args, **kwargs)
+        if handler is None:
+            return self.http_method_not_allowed(request, *args, **kwargs)
+        return handler(self, request, *args, **kwargs)
 
     def render(self, request: HttpRequest, template_name: str = None, context: Dict = None) -> HttpResponse:
         """Render component with VoltWire context"""
@@ -103,26 +233,56 @@ class VoltWireComponent(View):
 
         return render(request, template_name, context)
 
-    def _render_voltwire_response(self, request: HttpRequest, context: Dict) -> JsonResponse:
+    def _render_voltwire_response(self, request: HttpRequest, context: Dict) -> HttpResponse:
         """Render JSON response for VoltWire requests"""
-        from django.template.loader import render_to_string
-
         html_content = render_to_string(self.get_template_name(), context, request=request)
 
+        # Reuse the properties serialized while building the context
+        properties = context.get('voltwire_properties')
+        if properties is None:
+            properties = self._get_serialized_properties()
+
         response_data = {
             'success': True,
             'html': html_content,
-            'title': getattr(self, '_title', None),
+            'title': self._title,
             'errors': self._errors,
-            'properties': self._get_serialized_properties(),
+            'properties': properties,
             'messages': self._get_messages(request),
             'redirect': None,
         }
 
-        return JsonResponse(response_data)
+        use_msgpack = accepts_msgpack(request)
+        try:
+            response = self._build_voltwire_response(response_data, use_msgpack)
+        except _ENCODE_ERRORS:
+            # Send the properties the encoder rejects (e.g. dicts with tuple keys) as str()
+            response_data['properties'] = _encodable_properties(properties, packb if use_msgpack else dumps)
+            response = self._build_voltwire_response(response_data, use_msgpack)
+
+        # Responses are worth compressing; let caches know they vary by encoding
+        patch_vary_headers(response, ('Accept-Encoding',))
+        return response
+
+    def _build_voltwire_response(self, response_data: Dict, use_msgpack: bool) -> HttpResponse:
+        """Encode response data in the format the client asked for"""
+        # Clients that opt in get MessagePack with the HTML as raw bytes
+        if use_msgpack:
+            response = MsgPackResponse({**response_data, 'html': response_data['html'].encode('utf-8')})
+            patch_vary_headers(response, ('Accept',))
+            return response
+        # Encode large components chunk by chunk instead of building one JSON body
+        if self._stream or len(response_data['html']) > self._stream_threshold:
+            return StreamingJsonResponse(response_data, stream_key='html')
+        return FastJsonResponse(response_data)
 
     def get_template_name(self) -> str:
         """Get template name for this component"""
+        # Reuse the template resolved by a previous request for this class
+        resolved_template = type(self).__dict__.get('_resolved_template')
+        if resolved_template is not None:
+            return resolved_template
+
         class_name = self.__class__.__name__
         module = self.__class__.__module__
         app_name = module.split('.')[0]
@@ -134,8 +294,8 @@ class VoltWireComponent(View):
             template_name = f"VoltWire/{class_name}{ext}"
             # Check if template exists
             try:
-                from django.template.loader import get_template
                 get_template(template_name)
+                type(self)._resolved_template = template_name
                 return template_name
             except:
                 continue
@@ -145,51 +305,56 @@ class VoltWireComponent(View):
 
     def get_voltwire_context(self) -> Dict[str, Any]:
         """Get VoltWire-specific context data"""
+        properties = {}
         context = {
             'voltwire_component': self,
-            'voltwire_title': getattr(self, '_title', None),
-            'voltwire_properties': self._get_serialized_properties(),
+            'voltwire_title': self._title,
+            'voltwire_properties': properties,
             'voltwire_errors': self._errors,
         }
 
-        # Add all public properties to context
-        for attr_name in dir(self):
-            if not attr_name.startswith('_') and not callable(getattr(self, attr_name)):
-                context[attr_name] = getattr(self, attr_name)
+        # Add all public properties to context, serializing them in the same pass
+        for attr_name in self._reactive_names():
+            attr_value = getattr(self, attr_name)
+            context[attr_name] = attr_value
+            properties[attr_name] = _serialize_property(attr_value)
 
         return context
 
     def _get_serialized_properties(self) -> Dict[str, Any]:
         """Get serializable properties for client-side"""
         properties = {}
-        for attr_name in dir(self):
-            if attr_name.startswith('_'):
-                continue
-            attr_value = getattr(self, attr_name)
-            if not callable(attr_value):
-                try:
-                    json.dumps(attr_value)  # Test serialization
-                    properties[attr_name] = attr_value
-                except (TypeError, ValueError):
-                    properties[attr_name] = str(attr_value)
+        for attr_name in self._reactive_names():
+            properties[attr_name] = _serialize_property(getattr(self, attr_name))
         return properties
 
     def _get_messages(self, request: HttpRequest) -> List[Dict]:
         """Extract messages for VoltWire response"""
-        message_list = []
-        for message in messages.get_messages(request):
-            message_list.append({
-                'text': str(message),
-                'type': message.tags,
-                'level': message.level,
-            })
-        return message_list
+        storage = messages.get_messages(request)
+
+        # len() does not consume the storage, so empty responses skip iteration
+        if not len(storage):
+            return []
+
+        return [
+            {'text': str(message), 'type': message.tags, 'level': message.level}
+            for message in storage
+        ]
 
     def is_valid(self) -> bool:
         """Validate component properties"""
         self._errors = {}
 
-        for property_name, rules in self._validation_rules.items():
+        # Rules set on the instance (e.g. in mount()) take precedence over the class cache
+        if '_validation_rules' in self.__dict__:
+            parsed_rules = {
+                property_name: _parse_rules(rules)
+                for property_name, rules in self._validation_rules.items()
+            }
+        else:
+            parsed_rules = type(self)._parsed_validation_rules()
+
+        for property_name, rules in parsed_rules.items():
             if hasattr(self, property_name):
                 value = getattr(self, property_name)
                 errors = self._validate_property(property_name, value, rules)
@@ -198,29 +363,41 @@ class VoltWireComponent(View):
 
         return len(self._errors) == 0
 
-    def _validate_property(self, property_name: str, value: Any, rules: str) -> List[str]:
-        """Validate a single property against rules"""
-        errors = []
-        rule_list = [rule.strip() for rule in rules.split('|')]
+    @classmethod
+    def _parsed_validation_rules(cls) -> Dict[str, List[Tuple[str, Any]]]:
+        """
+        Validation rules of the component, parsed once per class.
+        Cached on the class so rule strings are not re-split on every request.
+        """
+        cached = cls.__dict__.get('_validation_rules_parsed')
+        if cached is not None:
+            return cached
 
-        for rule in rule_list:
-            if rule == 'required':
+        cls._validation_rules_parsed = {
+            property_name: _parse_rules(rules)
+            for property_name, rules in cls._validation_rules.items()
+        }
+        return cls._validation_rules_parsed
+
+    def _validate_property(self, property_name: str, value: Any, rules: List[Tuple[str, Any]]) -> List[str]:
+        """Validate a single property against parsed rules"""
+        errors = []
+        for kind, param in rules:
+            if kind == 'required':
                 if value is None or value == '':
                     errors.append('This field is required.')
-            elif rule.startswith('min:'):
-                min_val = int(rule.split(':')[1])
-                if isinstance(value, (int, float)) and value < min_val:
-                    errors.append(f'Value must be at least {min_val}.')
-                elif isinstance(value, str) and len(value) < min_val:
-                    errors.append(f'Must be at least {min_val} characters.')
-            elif rule.startswith('max:'):
-                max_val = int(rule.split(':')[1])
-                if isinstance(value, (int, float)) and value > max_val:
-                    errors.append(f'Value must be at most {max_val}.')
-                elif isinstance(value, str) and len(value) > max_val:
-                    errors.append(f'Must be at most {max_val} characters.')
-            elif rule == 'email':
-                if value and not re.match(r'^[^@]+@[^@]+\.[^@]+$', value):
+            elif kind == 'min':
+                if isinstance(value, (int, float)) and value < param:
+                    errors.append(f'Value must be at least {param}.')
+                elif isinstance(value, str) and len(value) < param:
+                    errors.append(f'Must be at least {param} characters.')
+            elif kind == 'max':
+                if isinstance(value, (int, float)) and value > param:
+                    errors.append(f'Value must be at most {param}.')
+                elif isinstance(value, str) and len(value) > param:
+                    errors.append(f'Must be at most {param} characters.')
+            elif kind == 'email':
+                if value and not _EMAIL_RE.match(value):
                     errors.append('Must be a valid email address.')
 
         return errors
@@ -236,9 +413,11 @@ class VoltWireComponent(View):
 
     def redirect(self, view_name: str, *args, **kwargs):
         """Redirect to another view"""
-        if self._is_voltwire_request:
+        # Also works when called outside dispatch(), which sets _is_voltwire_request
+        request = getattr(self, 'request', None)
+        if self._is_voltwire_request or (request is not None and _is_voltwire_request(request)):
             url = reverse(view_name, args=args, kwargs=kwargs)
-            return JsonResponse({
+            return FastJsonResponse({
                 'success': True,
                 'redirect': url
             })
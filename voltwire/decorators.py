@@ -1,7 +1,3 @@
-from functools import wraps
-from django.utils.decorators import available_attrs
-
-
 def layout(layout_name):
     """
     Decorator to specify layout for a component.
@@ -24,23 +20,4 @@ def title(page_title):
         cls._title = page_title
         return cls
 
-    return decorator
-
-
-def validate(rules):
-    """
-    Decorator to add validation rules to component properties.
-    Usage: @validate('required|min:3|max:255')
-    """
-
-    def decorator(field):
-        field_name = field.__name__
-
-        # Store validation rules in the class
-        if not hasattr(field, '_validation_rules'):
-            field._validation_rules = {}
-        field._validation_rules[field_name] = rules
-
-        return field
-
     return decorator
\ No newline at end of file
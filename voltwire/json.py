@@ -0,0 +1,74 @@
+import json
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse, StreamingHttpResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class VoltWireJSONEncoder(DjangoJSONEncoder):
+    """
+    JSON encoder used when orjson is not installed.
+    Falls back to str() for values that are not JSON serializable.
+    """
+
+    def default(self, o):
+        try:
+            return super().default(o)
+        except TypeError:
+            return str(o)
+
+
+def dumps(data) -> bytes:
+    """Serialize data to JSON bytes, using orjson when available"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits, which orjson rejects without calling default
+            pass
+    return json.dumps(data, cls=VoltWireJSONEncoder).encode('utf-8')
+
+
+class FastJsonResponse(HttpResponse):
+    """
+    JSON response for VoltWire requests.
+    Works like Django's JsonResponse, but encodes with orjson when installed.
+    """
+
+    def __init__(self, data, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(content=dumps(data), **kwargs)
+
+
+def iter_json(data, stream_key: str, chunk_size: int = 65536):
+    """
+    Return an iterator of JSON bytes for data, encoding the string at data[stream_key]
+    in chunks so the full encoded value is never held in memory at once.
+    The other keys are encoded up front, so encoding errors are raised before streaming.
+    """
+    value = data[stream_key]
+    rest = {key: item for key, item in data.items() if key != stream_key}
+    tail = b',' + dumps(rest)[1:] if rest else b'}'
+    return _iter_json_chunks(stream_key, value, tail, chunk_size)
+
+
+def _iter_json_chunks(stream_key: str, value: str, tail: bytes, chunk_size: int):
+    yield b'{' + dumps(stream_key) + b':"'
+    for start in range(0, len(value), chunk_size):
+        # Strip the surrounding quotes from each encoded chunk
+        yield dumps(value[start:start + chunk_size])[1:-1]
+    yield b'"' + tail
+
+
+class StreamingJsonResponse(StreamingHttpResponse):
+    """
+    Streaming JSON response for VoltWire requests with large payloads.
+    The string at data[stream_key] (e.g. rendered HTML) is encoded chunk by chunk.
+    """
+
+    def __init__(self, data, stream_key: str = 'html', chunk_size: int = 65536, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(streaming_content=iter_json(data, stream_key, chunk_size), **kwargs)
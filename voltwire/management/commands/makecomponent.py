@@ -3,6 +3,136 @@ from django.core.management.base import BaseCommand, CommandError
 from django.conf import settings
 from voltwire.utils import create_component_structure
 
+# Building blocks for generated component files, each ending with a newline
+_COMPONENT_PY_HEADER = """from voltwire import VoltWireComponent
+from django.shortcuts import render, redirect, get_object_or_404
+from django.contrib import messages
+"""
+
+_COMPONENT_PY_MODEL_IMPORT = """from .models import {model}
+"""
+
+_COMPONENT_PY_CLASS = """
+class {component_name}(VoltWireComponent):
+"""
+
+_COMPONENT_PY_LAYOUT = """    _layout = '{layout}'
+"""
+
+_COMPONENT_PY_GET = '''    # Reactive properties
+    title = ''
+    content = ''
+    is_published = False
+
+    def get(self, request):
+        """Handle GET requests"""
+'''
+
+_COMPONENT_PY_LOAD_OBJECT = """        if hasattr(self, 'object_id'):
+            self.obj = get_object_or_404({model}, pk=self.object_id)
+            self.title = self.obj.title
+            self.content = self.obj.content
+"""
+
+_COMPONENT_PY_POST = '''        return self.render(request)
+
+    def post(self, request):
+        """Handle POST requests"""
+        action = request.POST.get('voltwire_action')
+'''
+
+_COMPONENT_PY_CRUD_ACTIONS = """        if action == 'save':
+            return self.save(request)
+        elif action == 'delete':
+            return self.delete(request)
+"""
+
+_COMPONENT_PY_RENDER = """        return self.render(request)
+"""
+
+_CRUD_SAVE_BLOCK = '''
+    def save(self, request):
+        """Save action"""
+        if self.is_valid():
+'''
+
+_CRUD_MODEL_SAVE_BLOCK = """            if hasattr(self, 'obj'):
+                # Update existing
+                self.obj.title = self.title
+                self.obj.content = self.content
+                self.obj.save()
+            else:
+                # Create new
+                obj = {model}.objects.create(
+                    title=self.title,
+                    content=self.content,
+                )
+"""
+
+_CRUD_DELETE_BLOCK = '''            self.show_toast('Saved successfully!', type='success')
+            return self.redirect('home')
+        return self.render(request)
+
+    def delete(self, request):
+        """Delete action"""
+        if hasattr(self, 'obj'):
+            self.obj.delete()
+            self.show_toast('Deleted successfully!', type='success')
+            return self.redirect('home')
+        return self.render(request)
+'''
+
+# Building blocks for generated component templates
+_TEMPLATE_HEADER = """<!-- {component_name} VoltWire Component -->
+<div class="component {css_class}">
+    <h2>{{{{ voltwire_title|default:"{component_name}" }}}}</h2>
+
+    {{% if voltwire_errors %}}
+        <div class="errors">
+            {{% for field, errors in voltwire_errors.items %}}
+                {{% for error in errors %}}
+                    <div class="error">{{{{ field }}}}: {{{{ error }}}}</div>
+                {{% endfor %}}
+            {{% endfor %}}
+        </div>
+    {{% endif %}}
+
+"""
+
+_TEMPLATE_FORM = """    <form vw:submit="save">
+        <div class="form-group">
+            <label>Title</label>
+            <input type="text" vw:model="title" placeholder="Enter title">
+        </div>
+
+        <div class="form-group">
+            <label>Content</label>
+            <textarea vw:model="content" placeholder="Enter content"></textarea>
+        </div>
+
+        <div class="form-actions">
+            <button type="submit" vw:loading="saving">Save</button>
+"""
+
+_TEMPLATE_DELETE_BUTTON = """            <button type="button" vw:click="delete" vw:confirm="Are you sure?">Delete</button>
+"""
+
+_TEMPLATE_FORM_END = """        </div>
+    </form>
+"""
+
+_TEMPLATE_PLACEHOLDER = """    <p>Component content goes here.</p>
+    <button vw:click="handleAction">Click Me</button>
+"""
+
+_TEMPLATE_FOOTER = """</div>
+"""
+
+
+def _join_blocks(*blocks):
+    """Join the non-empty blocks into file content, without a trailing newline"""
+    return ''.join(block for block in blocks if block)[:-1]
+
 
 class Command(BaseCommand):
     help = 'Create a new VoltWire component'
@@ -84,107 +214,23 @@ class Command(BaseCommand):
 
     def _generate_component_py_content(self, context):
         """Generate Python component content"""
-        component_name = context['component_name']
-
-        lines = [
-            "from voltwire import VoltWireComponent",
-            "from django.shortcuts import render, redirect, get_object_or_404",
-            "from django.contrib import messages",
-        ]
-
-        if context['with_model']:
-            lines.append(f"from .models import {context['with_model']}")
-
-        lines.extend([
-            "",
-            f"class {component_name}(VoltWireComponent):",
-        ])
-
-        # Add layout decorator if specified
-        if context['layout']:
-            lines.append(f"    _layout = '{context['layout']}'")
-
-        # Add properties
-        lines.extend([
-            "    # Reactive properties",
-            "    title = ''",
-            "    content = ''",
-            "    is_published = False",
-        ])
-
-        # Add methods
-        lines.extend([
-            "",
-            "    def get(self, request):",
-            "        \"\"\"Handle GET requests\"\"\"",
-        ])
-
-        if context['with_model'] and context['crud']:
-            lines.extend([
-                "        if hasattr(self, 'object_id'):",
-                f"            self.obj = get_object_or_404({context['with_model']}, pk=self.object_id)",
-                "            self.title = self.obj.title",
-                "            self.content = self.obj.content",
-            ])
-
-        lines.extend([
-            "        return self.render(request)",
-            "",
-            "    def post(self, request):",
-            "        \"\"\"Handle POST requests\"\"\"",
-            "        action = request.POST.get('voltwire_action')",
-        ])
-
-        if context['crud']:
-            lines.extend([
-                "        if action == 'save':",
-                "            return self.save(request)",
-                "        elif action == 'delete':",
-                "            return self.delete(request)",
-            ])
-
-        lines.extend([
-            "        return self.render(request)",
-        ])
-
-        if context['crud']:
-            lines.extend([
-                "",
-                "    def save(self, request):",
-                "        \"\"\"Save action\"\"\"",
-                "        if self.is_valid():",
-            ])
-
-            if context['with_model']:
-                lines.extend([
-                    "            if hasattr(self, 'obj'):",
-                    "                # Update existing",
-                    "                self.obj.title = self.title",
-                    "                self.obj.content = self.content",
-                    "                self.obj.save()",
-                    "            else:",
-                    "                # Create new",
-                    f"                obj = {context['with_model']}.objects.create(",
-                    "                    title=self.title,",
-                    "                    content=self.content,",
-                    "                )",
-                ])
-
-            lines.extend([
-                "            self.show_toast('Saved successfully!', type='success')",
-                "            return self.redirect('home')",
-                "        return self.render(request)",
-                "",
-                "    def delete(self, request):",
-                "        \"\"\"Delete action\"\"\"",
-                "        if hasattr(self, 'obj'):",
-                "            self.obj.delete()",
-                "            self.show_toast('Deleted successfully!', type='success')",
-                "            return self.redirect('home')",
-                "        return self.render(request)",
-            ])
-
-        return '\n'.join(lines)
+        model = context['with_model']
+        crud = context['crud']
+
+        return _join_blocks(
+            _COMPONENT_PY_HEADER,
+            _COMPONENT_PY_MODEL_IMPORT.format(model=model) if model else '',
+            _COMPONENT_PY_CLASS.format(component_name=context['component_name']),
+            _COMPONENT_PY_LAYOUT.format(layout=context['layout']) if context['layout'] else '',
+            _COMPONENT_PY_GET,
+            _COMPONENT_PY_LOAD_OBJECT.format(model=model) if model and crud else '',
+            _COMPONENT_PY_POST,
+            _COMPONENT_PY_CRUD_ACTIONS if crud else '',
+            _COMPONENT_PY_RENDER,
+            _CRUD_SAVE_BLOCK if crud else '',
+            _CRUD_MODEL_SAVE_BLOCK.format(model=model) if model and crud else '',
+            _CRUD_DELETE_BLOCK if crud else '',
+        )
 
     def _create_template_file(self, file_path, component_name, options):
         """Create the template file"""
@@ -195,57 +241,12 @@ class Command(BaseCommand):
 
     def _generate_template_content(self, component_name, options):
         """Generate template content"""
-        lines = [
-            f"<!-- {component_name} VoltWire Component -->",
-            f"<div class=\"component {component_name.lower()}\">",
-            "    <h2>{{ voltwire_title|default:\"" + component_name + "\" }}</h2>",
-            "",
-            "    {% if voltwire_errors %}",
-            "        <div class=\"errors\">",
-            "            {% for field, errors in voltwire_errors.items %}",
-            "                {% for error in errors %}",
-            "                    <div class=\"error\">{{ field }}: {{ error }}</div>",
-            "                {% endfor %}",
-            "            {% endfor %}",
-            "        </div>",
-            "    {% endif %}",
-            "",
-        ]
-
-        if options['with_form'] or options['crud']:
-            lines.extend([
-                "    <form vw:submit=\"save\">",
-                "        <div class=\"form-group\">",
-                "            <label>Title</label>",
-                "            <input type=\"text\" vw:model=\"title\" placeholder=\"Enter title\">",
-                "        </div>",
-                "",
-                "        <div class=\"form-group\">",
-                "            <label>Content</label>",
-                "            <textarea vw:model=\"content\" placeholder=\"Enter content\"></textarea>",
-                "        </div>",
-                "",
-                "        <div class=\"form-actions\">",
-                "            <button type=\"submit\" vw:loading=\"saving\">Save</button>",
-            ])
-
-            if options['crud']:
-                lines.extend([
-                    "            <button type=\"button\" vw:click=\"delete\" vw:confirm=\"Are you sure?\">Delete</button>",
-                ])
-
-            lines.extend([
-                "        </div>",
-                "    </form>",
-            ])
-        else:
-            lines.extend([
-                "    <p>Component content goes here.</p>",
-                "    <button vw:click=\"handleAction\">Click Me</button>",
-            ])
-
-        lines.extend([
-            "</div>",
-        ])
-
-        return '\n'.join(lines)
\ No newline at end of file
+        with_form = options['with_form'] or options['crud']
+
+        return _join_blocks(
+            _TEMPLATE_HEADER.format(component_name=component_name, css_class=component_name.lower()),
+            _TEMPLATE_FORM if with_form else _TEMPLATE_PLACEHOLDER,
+            _TEMPLATE_DELETE_BUTTON if with_form and options['crud'] else '',
+            _TEMPLATE_FORM_END if with_form else '',
+            _TEMPLATE_FOOTER,
+        )
\ No newline at end of file
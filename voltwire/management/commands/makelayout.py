@@ -2,6 +2,48 @@ import os
 from django.core.management.base import BaseCommand
 from django.conf import settings
 
+_LAYOUT_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{{{ voltwire_title|default:"VoltWire App" }}}}</title>
+    
+    {{% voltwire_scripts %}}
+    
+    {{% style %}}
+    <style>
+        body {{ margin: 0; font-family: Arial, sans-serif; }}
+{css_block}
+    </style>
+    {{% endstyle %}}
+</head>
+<body>
+    <div class="layout-{layout_name}">
+        {{% if voltwire_messages %}}
+            {{% for message in voltwire_messages %}}
+                <div class="alert alert-{{{{ message.type }}}}">
+                    {{{{ message.text }}}}
+                </div>
+            {{% endfor %}}
+        {{% endif %}}
+        
+        <!-- Main content slot -->
+        {{{{ slot }}}}
+    </div>
+</body>
+</html>"""
+
+_LAYOUT_FULLWIDTH_CSS = """        .layout-{layout_name} {{ min-height: 100vh; }}
+        .main-content {{ padding: 20px; }}"""
+
+_LAYOUT_BOXED_CSS = """        .layout-{layout_name} {{ 
+            max-width: 1200px;
+            margin: 0 auto;
+            padding: 20px;
+            min-height: 100vh;
+        }}"""
+
 
 class Command(BaseCommand):
     help = 'Create a new VoltWire layout template'
@@ -38,57 +80,9 @@ class Command(BaseCommand):
 
     def _generate_layout_content(self, layout_name, options):
         """Generate layout template content"""
-        full_width = options['full_width']
-
-        lines = [
-            f"<!DOCTYPE html>",
-            f"<html lang=\"en\">",
-            f"<head>",
-            f"    <meta charset=\"UTF-8\">",
-            f"    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\">",
-            f"    <title>{{{{ voltwire_title|default:\"VoltWire App\" }}}}</title>",
-            f"    ",
-            f"    {{% voltwire_scripts %}}",
-            f"    ",
-            f"    {{% style %}}",
-            f"    <style>",
-            f"        body {{ margin: 0; font-family: Arial, sans-serif; }}",
-        ]
-
-        if full_width:
-            lines.extend([
-                f"        .layout-{layout_name} {{ min-height: 100vh; }}",
-                f"        .main-content {{ padding: 20px; }}",
-            ])
-        else:
-            lines.extend([
-                f"        .layout-{layout_name} {{ ",
-                f"            max-width: 1200px;",
-                f"            margin: 0 auto;",
-                f"            padding: 20px;",
-                f"            min-height: 100vh;",
-                f"        }}",
-            ])
-
-        lines.extend([
-            f"    </style>",
-            f"    {{% endstyle %}}",
-            f"</head>",
-            f"<body>",
-            f"    <div class=\"layout-{layout_name}\">",
-            f"        {{% if voltwire_messages %}}",
-            f"            {{% for message in voltwire_messages %}}",
-            f"                <div class=\"alert alert-{{{{ message.type }}}}\">",
-            f"                    {{{{ message.text }}}}",
-            f"                </div>",
-            f"            {{% endfor %}}",
-            f"        {{% endif %}}",
-            f"        ",
-            f"        <!-- Main content slot -->",
-            f"        {{{{ slot }}}}",
-            f"    </div>",
-            f"</body>",
-            f"</html>",
-        ])
+        css_template = _LAYOUT_FULLWIDTH_CSS if options['full_width'] else _LAYOUT_BOXED_CSS
 
-        return '\n'.join(lines)
\ No newline at end of file
+        return _LAYOUT_TEMPLATE.format(
+            layout_name=layout_name,
+            css_block=css_template.format(layout_name=layout_name),
+        )
\ No newline at end of file
@@ -1,6 +1,10 @@
 from django.core.management.base import BaseCommand
 from django.conf import settings
 import os
+import pathlib
+
+# Installed apps that never get a VoltWire components directory
+_SKIP_APPS = frozenset({'voltwire'})
 
 
 class Command(BaseCommand):
@@ -16,13 +20,7 @@ class Command(BaseCommand):
             )
 
         # Check if middleware is added
-        middleware_added = False
-        for middleware in settings.MIDDLEWARE:
-            if 'voltwire.middleware.VoltWireMiddleware' in middleware:
-                middleware_added = True
-                break
-
-        if not middleware_added:
+        if 'voltwire.middleware.VoltWireMiddleware' not in settings.MIDDLEWARE:
             self.stdout.write(
                 self.style.WARNING('Please add "voltwire.middleware.VoltWireMiddleware" to MIDDLEWARE in settings.py')
             )
@@ -32,19 +30,21 @@ class Command(BaseCommand):
         os.makedirs(static_dir, exist_ok=True)
 
         # Create sample VoltWire component structure
-        for app in settings.INSTALLED_APPS:
-            if app.startswith('django.') or app in ['voltwire']:
-                continue
-
-            # Create VoltWire directory in app
-            voltwire_dir = os.path.join(app.replace('.', '/'), 'VoltWire')
-            os.makedirs(voltwire_dir, exist_ok=True)
-
-            # Create __init__.py in VoltWire directory
-            init_file = os.path.join(voltwire_dir, '__init__.py')
-            if not os.path.exists(init_file):
-                with open(init_file, 'w') as f:
-                    f.write('# VoltWire components directory\n')
+        target_apps = [
+            app for app in settings.INSTALLED_APPS
+            if not app.startswith('django.') and app not in _SKIP_APPS
+        ]
+        # Collect the VoltWire directories first so each one is created only once
+        voltwire_dirs = {pathlib.Path(*app.split('.')) / 'VoltWire' for app in target_apps}
+
+        for voltwire_dir in sorted(voltwire_dirs):
+            voltwire_dir.mkdir(parents=True, exist_ok=True)
+
+            # Create __init__.py in VoltWire directory, keeping existing content
+            init_file = voltwire_dir / '__init__.py'
+            init_file.touch(exist_ok=True)
+            if not init_file.stat().st_size:
+                init_file.write_text('# VoltWire components directory\n')
 
         self.stdout.write(
             self.style.SUCCESS('VoltWire installed successfully!')
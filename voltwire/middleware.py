@@ -1,10 +1,33 @@
 import re
-from django.utils.deprecation import MiddlewareMixin
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.urls import resolve, Resolver404
 
+# Script tag injected before </head> of HTML responses
+_SCRIPT_INJECT_BYTES = b'<script src="/static/voltwire/js/voltwire.js"></script>\n'
 
-class VoltWireMiddleware(MiddlewareMixin):
+# VOLTWIRE settings, read once instead of on every response
+_AUTO_INCLUDE = True
+
+
+def _reload_settings():
+    """Read the VoltWire settings used by the middleware"""
+    global _AUTO_INCLUDE
+    _AUTO_INCLUDE = getattr(settings, 'VOLTWIRE', {}).get('AUTO_INCLUDE_SCRIPTS', True)
+
+
+_reload_settings()
+
+
+@receiver(setting_changed)
+def _voltwire_setting_changed(setting, **kwargs):
+    """Pick up VOLTWIRE changes made with override_settings()"""
+    if setting == 'VOLTWIRE':
+        _reload_settings()
+
+
+class VoltWireMiddleware:
     """
     Middleware to handle VoltWire-specific functionality:
     - SPA navigation
@@ -13,45 +36,30 @@ class VoltWireMiddleware(MiddlewareMixin):
     """
 
     def __init__(self, get_response):
-        super().__init__(get_response)
         self.get_response = get_response
 
-    def process_request(self, request):
-        """Process incoming requests for VoltWire features"""
-        # Check if this is a VoltWire SPA request
-        if self._is_voltwire_spa_request(request):
-            request.is_voltwire_spa = True
-
-        # Check if this is a VoltWire component request
-        if self._is_voltwire_component_request(request):
-            request.is_voltwire_component = True
+    def __call__(self, request):
+        """Process requests and responses for VoltWire features"""
+        # Flag SPA and component requests once so downstream code doesn't re-read headers
+        meta = request.META
+        request.is_voltwire_spa = (meta.get('HTTP_X_VOLTWIRE_SPA') == 'true' or
+                                   getattr(request, 'is_voltwire_spa', False))
+        request.is_voltwire_component = meta.get('HTTP_X_VOLTWIRE_REQUEST') == 'true'
 
-        return None
+        response = self.get_response(request)
 
-    def process_response(self, request, response):
-        """Process outgoing responses for VoltWire features"""
         # Add VoltWire headers for SPA requests
-        if hasattr(request, 'is_voltwire_spa') and request.is_voltwire_spa:
+        if request.is_voltwire_spa:
             response['X-VoltWire-SPA'] = 'true'
 
         # Add JavaScript for auto-inclusion
-        if (getattr(settings, 'VOLTWIRE', {}).get('AUTO_INCLUDE_SCRIPTS', True) and
+        if (_AUTO_INCLUDE and
                 response.get('content-type', '').startswith('text/html') and
                 not getattr(response, 'streaming', False)):
 
-            content = response.content.decode('utf-8')
-            if '</head>' in content:
-                script_tag = '<script src="/static/voltwire/js/voltwire.js"></script>'
-                content = content.replace('</head>', f'{script_tag}\n</head>')
-                response.content = content.encode('utf-8')
-
-        return response
-
-    def _is_voltwire_spa_request(self, request):
-        """Check if request is for SPA navigation"""
-        return (request.headers.get('X-VoltWire-SPA') == 'true' or
-                getattr(request, 'is_voltwire_spa', False))
+            # Work on the raw bytes to avoid decoding and re-encoding the whole body
+            head, sep, tail = response.content.partition(b'</head>')
+            if sep:
+                response.content = b''.join((head, _SCRIPT_INJECT_BYTES, sep, tail))
 
-    def _is_voltwire_component_request(self, request):
-        """Check if request is for component update"""
-        return request.headers.get('X-VoltWire-Request') == 'true'
\ No newline at end of file
+        return response
\ No newline at end of file
@@ -0,0 +1,48 @@
+from django.http import HttpRequest, HttpResponse
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+MSGPACK_CONTENT_TYPE = 'application/msgpack'
+
+
+def accepts_msgpack(request: HttpRequest) -> bool:
+    """
+    Check if the client asked for MessagePack and msgpack is installed.
+    Only an explicit application/msgpack media range opts in; wildcards and q=0 do not.
+    """
+    if msgpack is None:
+        return False
+
+    for media_range in request.META.get('HTTP_ACCEPT', '').split(','):
+        media_type, *params = media_range.split(';')
+        if media_type.strip().lower() != MSGPACK_CONTENT_TYPE:
+            continue
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    return float(value) > 0
+                except ValueError:
+                    return False
+        return True
+
+    return False
+
+
+def packb(data) -> bytes:
+    """Serialize data to MessagePack, sending bytes as bin and unknown types as str()"""
+    return msgpack.packb(data, use_bin_type=True, default=str)
+
+
+class MsgPackResponse(HttpResponse):
+    """
+    MessagePack response for VoltWire requests.
+    Values passed as bytes (e.g. rendered HTML) are sent as raw bin data, without escaping.
+    """
+
+    def __init__(self, data, **kwargs):
+        kwargs.setdefault('content_type', MSGPACK_CONTENT_TYPE)
+        super().__init__(content=packb(data), **kwargs)
\ No newline at end of file
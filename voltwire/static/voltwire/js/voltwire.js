@@ -3,6 +3,8 @@ class VoltWire {
     constructor() {
         this.components = new Map();
         this.spaEnabled = true;
+        // Opt in to MessagePack responses (requires msgpack on the server)
+        this.msgpackEnabled = false;
         this.init();
     }
 
@@ -140,16 +142,21 @@ class VoltWire {
                 formData.append(key, value);
             }
 
+            const headers = {
+                'X-VoltWire-Request': 'true',
+                'X-Requested-With': 'XMLHttpRequest',
+            };
+            if (this.msgpackEnabled) {
+                headers['Accept'] = 'application/msgpack, application/json';
+            }
+
             const response = await fetch(window.location.href, {
                 method: 'POST',
-                headers: {
-                    'X-VoltWire-Request': 'true',
-                    'X-Requested-With': 'XMLHttpRequest',
-                },
+                headers: headers,
                 body: formData
             });
 
-            const data = await response.json();
+            const data = await this.parseResponse(response);
             await this.handleResponse(data);
 
         } catch (error) {
@@ -159,6 +166,107 @@ class VoltWire {
         }
     }
 
+    async parseResponse(response) {
+        const contentType = response.headers.get('Content-Type') || '';
+        if (!contentType.startsWith('application/msgpack')) {
+            return response.json();
+        }
+
+        const data = this.decodeMsgpack(new Uint8Array(await response.arrayBuffer()));
+        // HTML is sent as raw bytes
+        if (data.html instanceof Uint8Array) {
+            data.html = new TextDecoder().decode(data.html);
+        }
+        return data;
+    }
+
+    decodeMsgpack(bytes) {
+        // Minimal MessagePack decoder for VoltWire responses
+        const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+        const textDecoder = new TextDecoder();
+        let offset = 0;
+
+        const readBytes = (length) => {
+            const value = bytes.subarray(offset, offset + length);
+            offset += length;
+            return value;
+        };
+        const readString = (length) => textDecoder.decode(readBytes(length));
+        const readArray = (length) => {
+            const value = [];
+            for (let i = 0; i < length; i++) {
+                value.push(read());
+            }
+            return value;
+        };
+        const readMap = (length) => {
+            const value = {};
+            for (let i = 0; i < length; i++) {
+                const key = read();
+                value[key] = read();
+            }
+            return value;
+        };
+        const readUint = (size) => {
+            let value;
+            if (size === 1) value = view.getUint8(offset);
+            else if (size === 2) value = view.getUint16(offset);
+            else if (size === 4) value = view.getUint32(offset);
+            else value = Number(view.getBigUint64(offset));
+            offset += size;
+            return value;
+        };
+        const readInt = (size) => {
+            let value;
+            if (size === 1) value = view.getInt8(offset);
+            else if (size === 2) value = view.getInt16(offset);
+            else if (size === 4) value = view.getInt32(offset);
+            else value = Number(view.getBigInt64(offset));
+            offset += size;
+            return value;
+        };
+
+        const read = () => {
+            const type = bytes[offset++];
+
+            if (type <= 0x7f) return type;
+            if (type <= 0x8f) return readMap(type & 0x0f);
+            if (type <= 0x9f) return readArray(type & 0x0f);
+            if (type <= 0xbf) return readString(type & 0x1f);
+            if (type >= 0xe0) return type - 0x100;
+
+            switch (type) {
+                case 0xc0: return null;
+                case 0xc2: return false;
+                case 0xc3: return true;
+                case 0xc4: return readBytes(readUint(1));
+                case 0xc5: return readBytes(readUint(2));
+                case 0xc6: return readBytes(readUint(4));
+                case 0xca: { const value = view.getFloat32(offset); offset += 4; return value; }
+                case 0xcb: { const value = view.getFloat64(offset); offset += 8; return value; }
+                case 0xcc: return readUint(1);
+                case 0xcd: return readUint(2);
+                case 0xce: return readUint(4);
+                case 0xcf: return readUint(8);
+                case 0xd0: return readInt(1);
+                case 0xd1: return readInt(2);
+                case 0xd2: return readInt(4);
+                case 0xd3: return readInt(8);
+                case 0xd9: return readString(readUint(1));
+                case 0xda: return readString(readUint(2));
+                case 0xdb: return readString(readUint(4));
+                case 0xdc: return readArray(readUint(2));
+                case 0xdd: return readArray(readUint(4));
+                case 0xde: return readMap(readUint(2));
+                case 0xdf: return readMap(readUint(4));
+                default:
+                    throw new Error(`Unsupported MessagePack type: 0x${type.toString(16)}`);
+            }
+        };
+
+        return read();
+    }
+
     async updateProperty(componentName, property, value) {
         const component = this.getComponentData(componentName);
         if (!component) return;
@@ -1,17 +1,46 @@
 from django import template
+from django.core.signals import setting_changed
+from django.template import TemplateDoesNotExist
+from django.dispatch import receiver
 from django.template.loader import get_template
+from django.utils.autoreload import file_changed
 from django.utils.safestring import mark_safe
+import functools
 import json
 
 register = template.Library()
 
+# Markup returned by {% voltwire_scripts %}, marked safe once at import
+_VW_SCRIPTS = mark_safe('<script src="/static/voltwire/js/voltwire.js"></script>')
+
+_NOT_FOUND_FMT = '<!-- Component {} not found -->'.format
+
+# Compact JSON encoder for values embedded in HTML attributes
+_JSON_ENCODER = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False).encode
+
+# Templates rendered by {% component %}, cached by name
+_get_template_cached = functools.lru_cache(maxsize=128)(get_template)
+
+
+@receiver(file_changed)
+def _clear_template_cache(sender, file_path, **kwargs):
+    """Drop cached templates when the autoreloader sees a file change"""
+    _get_template_cached.cache_clear()
+
+
+@receiver(setting_changed)
+def _templates_setting_changed(setting, **kwargs):
+    """Drop cached templates when the template engines are reset by override_settings()"""
+    if setting == 'TEMPLATES':
+        _get_template_cached.cache_clear()
+
 
 @register.simple_tag
 def voltwire_scripts():
     """
     Include VoltWire JavaScript files.
     """
-    return mark_safe('<script src="/static/voltwire/js/voltwire.js"></script>')
+    return _VW_SCRIPTS
 
 
 @register.simple_tag
@@ -38,15 +67,15 @@ def component(component_name, **props):
             from django.template import RequestContext
             context = component_instance.get_voltwire_context()
 
-            # Get template
+            # Get template (the name is memoized on the component class)
             template_name = component_instance.get_template_name()
-            template_obj = get_template(template_name)
+            template_obj = _get_template_cached(template_name)
 
             return template_obj.render(context)
         else:
-            return f"<!-- Component {component_name} not found -->"
+            return _NOT_FOUND_FMT(component_name)
 
-    except Exception as e:
+    except (ImportError, AttributeError, TemplateDoesNotExist) as e:
         return f"<!-- Error rendering component {component_name}: {str(e)} -->"
 
 
@@ -55,19 +84,9 @@ def do_voltwire_component(parser, token):
     """
     Define a component directly in templates using voltwire tag.
     """
-    try:
-        # Parse the component definition
-        components = []
-        while True:
-            token = parser.next_token()
-            if token.contents == 'endvoltwire':
-                break
-            components.append(token)
-
-        # For now, return empty string - full implementation would parse YAML-like syntax
-        return template.Node()
-    except template.TemplateSyntaxError:
-        return template.Node()
+    # Discard the block body - full implementation would parse YAML-like syntax
+    parser.skip_past('endvoltwire')
+    return template.Node()
 
 
 @register.simple_tag
@@ -78,7 +97,7 @@ def voltwire_include(template_name):
     try:
         template_obj = get_template(template_name)
         return template_obj.render({})
-    except:
+    except TemplateDoesNotExist:
         return f"<!-- Error including {template_name} -->"
 
 
@@ -87,4 +106,4 @@ def voltwire_json(value):
     """
     Convert value to JSON for VoltWire attributes.
     """
-    return mark_safe(json.dumps(value))
\ No newline at end of file
+    return mark_safe(_JSON_ENCODER(value))
\ No newline at end of file
@@ -1,28 +1,55 @@
 import os
+import functools
 import importlib
 from django.apps import apps
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 
+# Template extensions, read from settings once instead of on every lookup
+_TEMPLATE_EXTENSIONS = ('.vw.html', '.html')
 
+
+def _reload_settings():
+    """Read the VoltWire settings used by the helpers in this module"""
+    global _TEMPLATE_EXTENSIONS
+    _TEMPLATE_EXTENSIONS = tuple(
+        getattr(settings, 'VOLTWIRE', {}).get('TEMPLATE_EXTENSIONS', ['.vw.html', '.html'])
+    )
+
+
+_reload_settings()
+
+
+@receiver(setting_changed)
+def _voltwire_setting_changed(setting, **kwargs):
+    """Pick up VOLTWIRE changes made with override_settings()"""
+    if setting == 'VOLTWIRE':
+        _reload_settings()
+        get_component_template_paths.cache_clear()
+
+
+@functools.lru_cache(maxsize=256)
 def get_component_template_paths(component_name: str, app_name: str = None):
     """
     Get possible template paths for a component.
     Supports both .vw.html and .html extensions.
+    Returns a tuple, as the result is cached and shared between callers.
     """
-    extensions = getattr(settings, 'VOLTWIRE', {}).get('TEMPLATE_EXTENSIONS', ['.vw.html', '.html'])
-
     template_paths = []
-    for ext in extensions:
+    for ext in _TEMPLATE_EXTENSIONS:
         if app_name:
             template_paths.append(f"{app_name}/VoltWire/{component_name}{ext}")
         template_paths.append(f"VoltWire/{component_name}{ext}")
 
-    return template_paths
+    return tuple(template_paths)
 
 
+@functools.lru_cache(maxsize=256)
 def find_component_class(component_path: str):
     """
     Find and import a component class by its path.
+    Results are cached, including None for paths that cannot be imported.
     """
     try:
         module_path, class_name = component_path.rsplit('.', 1)
@@ -1,4 +1,4 @@
-import importlib
+from django.core.exceptions import ImproperlyConfigured
 from django.http import HttpRequest, HttpResponse
 from django.utils.module_loading import import_string
 
@@ -8,15 +8,15 @@ def voltwire_view(component_path: str):
     View function wrapper for VoltWire components.
     Usage: path('posts/create/', voltwire_view('posts.CreatePost'), name='post_create')
     """
+    # Resolve the component once when the URLconf is loaded, not on every request
+    try:
+        component_class = import_string(component_path)
+    except ImportError as e:
+        raise ImproperlyConfigured(
+            f"VoltWire component not found: {component_path} ({e})"
+        ) from e
 
     def view_wrapper(request: HttpRequest, *args, **kwargs):
-        # Import and instantiate the component
-        try:
-            component_class = import_string(f"{component_path}")
-            component_instance = component_class()
-            return component_instance.dispatch(request, *args, **kwargs)
-        except (ImportError, AttributeError) as e:
-            from django.http import HttpResponseServerError
-            return HttpResponseServerError(f"Component not found: {component_path}")
+        return component_class().dispatch(request, *args, **kwargs)
 
     return view_wrapper
\ No newline at end of file